@@ -3,12 +3,43 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    SessionNotCreatedException,
+    WebDriverException,
+)
+from lxml import etree, html as lxml_html
+from PIL import Image
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+from requests.adapters import HTTPAdapter
+import aiohttp
+import asyncio
+import collections
+import io
+import multiprocessing
 import os
+import queue
 import requests
-import time
+import signal
+import sys
+import threading
 
 from utils import Utils
 
+# Selectors are defined once and reused across every page load
+_XPATH_FACTIONS_MENU = "/html/body/div[1]/div[1]/div[1]/div[1]/div[2]/div[5]/div[2]/div"
+_CSS_ARMY_LIST_BUTTON = "#btnArmyList"
+_CSS_ARMY_LIST_TOOLTIP = "#tooltip_contentArmyList"
+_CSS_DATA_CARD = "#wrapper > div:nth-of-type(4)"
+_CSS_COOKIES_SETTINGS = "#ez-manage-settings"
+_CSS_COOKIES_SAVE = "#ez-save-settings"
+
+# Compiled at import time and reused across all the static pages
+_XPATH_LINKS_HREFS = etree.XPath(".//a/@href")
+_XPATH_FACTIONS_HREFS = etree.XPath(_XPATH_FACTIONS_MENU + "//a/@href")
+_XPATH_UNITS_HREFS = etree.XPath('//*[@id="tooltip_contentArmyList"]//a/@href')
+
 
 class WebScraper:
     """
@@ -21,17 +52,55 @@ class WebScraper:
         """
         self.output_dir = "./out/factions/"
         self.source_dir = "./out/source/"
+        self.cache_dir = "./.cache/"
+        # "png" or "webp", both lossless
+        self.card_format = "png"
 
         self.base_url = "https://wahapedia.ru/wh40k10ed/"
         self.factions_url = self.base_url + "factions/"
         self.home_url = "https://wahapedia.ru/wh40k10ed/the-rules/quick-start-guide/"
 
+        self.ublock_url = "https://addons.mozilla.org/firefox/downloads/latest/ublock-origin/addon-1318898-latest.xpi"
+        self.ublock_path = self.cache_dir + "ublock_origin.xpi"
+        self.ublock_meta_path = self.ublock_path + ".meta"
+        self.shipped_ublock_path = "./docs/assets/extensions/ublock_origin.xpi"
+
+        self.max_connections = 16
+        self.dns_cache_ttl = 3600
+        self.request_timeout = 30
+        self.workers = min(4, os.cpu_count() or 1)
+        # Threads use less memory than processes, each one still gets its own browser
+        self.use_threads = False
+        self.checkpoint_interval = 10
+
         self.check_for_cookies = True
 
+        self.http_session = requests.Session()
+        self.http_session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        )
+
         self.driver = None
+        self.scrapers_pool = queue.Queue()
         self.factions_names = []
         self.factions_dict = {}
 
+    def __enter__(self) -> "WebScraper":
+        """
+        Enters the context of the scraper. The browser session is started lazily.
+
+        Returns:
+            WebScraper: The scraper.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Exits the context of the scraper, closing the browser session if one was started.
+        """
+        if self.driver is not None:
+            self.close_session()
+
     @Utils.loading(
         "Ensuring output directories exist...",
         "Output directories exist.",
@@ -47,10 +116,75 @@ class WebScraper:
         try:
             os.makedirs(self.output_dir, exist_ok=True)
             os.makedirs(self.source_dir, exist_ok=True)
+            os.makedirs(self.cache_dir, exist_ok=True)
             return 0
         except Exception:
             return 1
 
+    @Utils.loading(
+        "Checking for uBlock Origin updates...",
+        "uBlock Origin is up to date.",
+        "Failed to check for uBlock Origin updates.",
+    )
+    def download_ublock(self) -> int:
+        """
+        Downloads uBlock Origin, only transferring it when it changed since the last download.
+
+        Returns:
+            int: 0 if successful, 1 otherwise.
+        """
+        try:
+            headers = {}
+            # Without the validators of a previous download, the whole add-on is fetched
+            if os.path.exists(self.ublock_path) and os.path.isfile(
+                self.ublock_meta_path + ".json"
+            ):
+                meta = Utils.load_json_dict(self.ublock_meta_path + ".json")
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with self.http_session.get(
+                self.ublock_url, headers=headers, stream=True, timeout=30
+            ) as response:
+                if response.status_code == 304:
+                    return 0
+                response.raise_for_status()
+                # Streamed to a partial file so that an interrupted download is never used
+                with open(self.ublock_path + ".part", "wb") as file:
+                    for chunk in response.iter_content(65536):
+                        file.write(chunk)
+                meta = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+
+            os.replace(self.ublock_path + ".part", self.ublock_path)
+            Utils.dump_dict_to_json(meta, self.ublock_meta_path)
+            return 0
+        except Exception:
+            return 1
+
+    def update_ublock_in_background(self) -> threading.Thread:
+        """
+        Checks for uBlock Origin updates in a background thread, so that the job never waits for
+        the download. The browsers started meanwhile install the copy already on disk.
+
+        Returns:
+            threading.Thread: The thread checking for updates.
+        """
+
+        def update() -> None:
+            # The spinner would be drawn over the progress of the job
+            Utils.silence_spinners()
+            self.download_ublock()
+
+        thread = threading.Thread(target=update, daemon=True)
+        thread.start()
+        return thread
+
     @Utils.loading(
         "Installing uBlock Origin...",
         "uBlock Origin installed.",
@@ -64,15 +198,11 @@ class WebScraper:
             int: 0 if successful, 1 otherwise.
         """
         try:
-            ublock_url = "https://addons.mozilla.org/firefox/downloads/latest/ublock-origin/addon-1318898-latest.xpi"
-            ublock_path = "./docs/assets/extensions/ublock_origin.xpi"
-
-            if not os.path.exists(ublock_path):
-                response = requests.get(ublock_url)
-                with open(ublock_path, "wb") as file:
-                    file.write(response.content)
-
-            self.driver.install_addon(ublock_path)
+            # The copy shipped with the repository is used until one has been downloaded
+            if os.path.exists(self.ublock_path):
+                self.driver.install_addon(self.ublock_path)
+            else:
+                self.driver.install_addon(self.shipped_ublock_path)
             return 0
         except Exception:
             return 1
@@ -87,8 +217,22 @@ class WebScraper:
         Returns:
             list: The names of the elements.
         """
-        links = html.find_elements(By.TAG_NAME, "a")
-        hrefs = [link.get_attribute("href") for link in links]
+        # A single round trip, the links are then parsed locally like the static pages
+        source = html.get_attribute("outerHTML")
+        tree = lxml_html.fragment_fromstring(source, create_parent=True)
+        return self.get_names_from_hrefs(_XPATH_LINKS_HREFS(tree))
+
+    @staticmethod
+    def get_names_from_hrefs(hrefs: list) -> list:
+        """
+        Gets the names of the elements from their links.
+
+        Args:
+            hrefs (list): The links to get the names from.
+
+        Returns:
+            list: The names of the elements.
+        """
         names = [href.split("/")[-1] for href in hrefs]
 
         # Remove datasheets.html as it is not a valid name
@@ -114,11 +258,33 @@ class WebScraper:
         driver_options.add_argument("--height=" + str(height))
         if headless:
             driver_options.add_argument("--headless")
+        # Do not wait for every ad and iframe to load, the data card is awaited on its own
+        driver_options.page_load_strategy = "eager"
+        # Skip resources the data cards do not need: third-party images, media and WebAssembly
+        driver_options.set_preference("permissions.default.image", 3)
+        driver_options.set_preference("media.autoplay.default", 5)
+        driver_options.set_preference("javascript.options.wasm", False)
 
         self.driver = Browser(options=driver_options)
-        self.ensure_dirs_exist()
+        self.driver.set_script_timeout(10)
         self.install_ublock()
-        self.remove_cookies()
+
+    def navigate(self, url: str) -> None:
+        """
+        Navigates to a page, starting the session first if needed and dismissing the cookies banner
+        on the first page of the session.
+
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            None
+        """
+        if self.driver is None:
+            self.init_session()
+        self.driver.get(url)
+        if self.check_for_cookies:
+            self.remove_cookies()
 
     @Utils.loading(
         "Closing session...",
@@ -137,6 +303,9 @@ class WebScraper:
             return 0
         except Exception:
             return 1
+        finally:
+            self.driver = None
+            self.check_for_cookies = True
 
     @Utils.loading(
         "Removing cookies...",
@@ -145,17 +314,18 @@ class WebScraper:
     )
     def remove_cookies(self) -> int:
         """
-        Removes the cookies from the browser.
+        Dismisses the cookies banner of the current page, once per session.
 
         Returns:
             int: 0 if successful, 1 otherwise.
         """
         if not self.check_for_cookies:
             return 0
-        self.driver.get(self.home_url)
+        # Only wait for the banner once, uBlock Origin may keep it from showing up at all
+        self.check_for_cookies = False
         try:
             cookies_button = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, '//*[@id="ez-manage-settings"]'))
+                EC.element_to_be_clickable((By.CSS_SELECTOR, _CSS_COOKIES_SETTINGS))
             )
             cookies_button.click()
         except Exception:
@@ -163,13 +333,12 @@ class WebScraper:
 
         try:
             save_exit_button = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, '//*[@id="ez-save-settings"]'))
+                EC.element_to_be_clickable((By.CSS_SELECTOR, _CSS_COOKIES_SAVE))
             )
             save_exit_button.click()
         except Exception:
             return 1
 
-        self.check_for_cookies = False
         return 0
 
     @Utils.loading(
@@ -185,15 +354,10 @@ class WebScraper:
             int: 0 if successful, 1 otherwise.
         """
         try:
-            self.driver.get(self.home_url)
+            self.navigate(self.home_url)
 
             menu = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        "/html/body/div[1]/div[1]/div[1]/div[1]/div[2]/div[5]/div[2]/div",
-                    )
-                )
+                EC.presence_of_element_located((By.XPATH, _XPATH_FACTIONS_MENU))
             )
 
             self.factions_names = self.get_names_from_html(menu)
@@ -201,6 +365,29 @@ class WebScraper:
         except Exception:
             return 1
 
+    @Utils.loading(
+        "Fetching factions names from the static menu...",
+        "Factions names fetched.",
+        "Failed to fetch factions names from the static menu.",
+    )
+    def fetch_factions_names_static(self) -> int:
+        """
+        Fetches the names of the factions from the static HTML of the menu, without the browser.
+
+        Returns:
+            int: 0 if successful, 1 otherwise.
+        """
+        try:
+            response = self.http_session.get(self.home_url, timeout=10)
+            response.raise_for_status()
+            hrefs = _XPATH_FACTIONS_HREFS(lxml_html.fromstring(response.text))
+            hrefs = [href for href in hrefs if "/factions/" in href]
+
+            self.factions_names = self.get_names_from_hrefs(hrefs)
+            return 0 if self.factions_names else 1
+        except Exception:
+            return 1
+
     @Utils.loading(
         "Fetching units names from faction name...",
         "Units names fetched.",
@@ -217,25 +404,172 @@ class WebScraper:
             int: 0 if successful, 1 otherwise.
         """
         try:
-            self.driver.get(self.factions_url + faction_name)
+            self.navigate(self.factions_url + faction_name)
 
             button = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.XPATH, '//*[@id="btnArmyList"]'))
+                EC.presence_of_element_located((By.CSS_SELECTOR, _CSS_ARMY_LIST_BUTTON))
             )
             actions = ActionChains(self.driver)
 
             actions.move_to_element(button).perform()
 
-            time.sleep(1)
-            tooltip = self.driver.find_elements(
-                By.XPATH, '//*[@id="tooltip_contentArmyList"]'
+            # The hidden template of the tooltip shares its id, only its visible copy is wanted
+            tooltip = WebDriverWait(self.driver, 5).until(
+                EC.visibility_of_any_elements_located(
+                    (By.CSS_SELECTOR, _CSS_ARMY_LIST_TOOLTIP)
+                )
+            )[0]
+
+            self.factions_dict[faction_name] = self.get_names_from_html(tooltip)
+            return 0
+        except Exception:
+            return 1
+
+    @staticmethod
+    async def _fetch_html(session: aiohttp.ClientSession, url: str) -> str:
+        """
+        Fetches the static HTML of a page.
+
+        Args:
+            session (aiohttp.ClientSession): The session to fetch the page with.
+            url (str): The URL of the page.
+
+        Returns:
+            str: The HTML of the page.
+        """
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return await response.text()
+
+    async def fetch_all_faction_indexes(self) -> None:
+        """
+        Fetches the units names of every faction from their static pages, in parallel.
+
+        Factions whose page could not be fetched or parsed are left to None.
+
+        Returns:
+            None
+        """
+        urls = [self.factions_url + faction_name for faction_name in self.factions_names]
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections, ttl_dns_cache=self.dns_cache_ttl
+        )
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            pages = await asyncio.gather(
+                *[self._fetch_html(session, url) for url in urls],
+                return_exceptions=True,
             )
 
-            self.factions_dict[faction_name] = self.get_names_from_html(tooltip[1])
+        for faction_name, page in zip(self.factions_names, pages):
+            if isinstance(page, Exception):
+                continue
+            try:
+                hrefs = _XPATH_UNITS_HREFS(lxml_html.fromstring(page))
+            except etree.ParserError:
+                continue
+            if hrefs:
+                self.factions_dict[faction_name] = self.get_names_from_hrefs(hrefs)
+
+    @Utils.loading(
+        "Fetching units names from factions pages...",
+        "Units names fetched.",
+        "Failed to fetch units names from factions pages.",
+    )
+    def fetch_units_names_static(self) -> int:
+        """
+        Fetches the names of the units of every faction without the browser.
+
+        Returns:
+            int: 0 if successful, 1 otherwise.
+        """
+        try:
+            asyncio.run(self.fetch_all_faction_indexes())
             return 0
         except Exception:
             return 1
 
+    @Utils.retry(
+        (WebDriverException,),
+        excluded=(InvalidSessionIdException, SessionNotCreatedException),
+    )
+    def capture_data_card(self, url: str) -> bytes:
+        """
+        Captures the data card of a unit page, retrying on transient browser failures.
+
+        Args:
+            url (str): The URL of the unit page.
+
+        Returns:
+            bytes: The screenshot of the data card, as PNG.
+        """
+        try:
+            return self.screenshot_data_card(url)
+        except (InvalidSessionIdException, SessionNotCreatedException):
+            # The browser is gone, the next navigation starts a new one instead of reusing it
+            if self.driver is not None:
+                self.close_session()
+            raise
+
+    def screenshot_data_card(self, url: str) -> bytes:
+        """
+        Loads a unit page and takes the screenshot of its data card.
+
+        Args:
+            url (str): The URL of the unit page.
+
+        Returns:
+            bytes: The screenshot of the data card, as PNG.
+        """
+        self.navigate(url)
+
+        # Wait for the card, remove the army list button out of the way of the screenshot, then
+        # wait for the stylesheets, fonts, images and background images of the card only, instead
+        # of the whole page, in a single command
+        data_card = self.driver.execute_async_script(
+            r"""
+            const done = arguments[arguments.length - 1];
+            const present = (selector) => new Promise((resolve) => {
+                const poll = () => {
+                    const element = document.querySelector(selector);
+                    element ? resolve(element) : setTimeout(poll, 50);
+                };
+                poll();
+            });
+            const loaded = (element) => new Promise((resolve) => {
+                element.addEventListener("load", resolve);
+                element.addEventListener("error", resolve);
+            });
+            (async () => {
+                const card = await present(arguments[0]);
+                document.querySelector(arguments[1])?.remove();
+                await Promise.all(
+                    Array.from(document.querySelectorAll('link[rel="stylesheet"]'))
+                        .filter((link) => !link.sheet)
+                        .map(loaded)
+                );
+                // Once styled, the layout of the card triggers the loading of its fonts
+                card.getBoundingClientRect();
+                const images = Array.from(card.querySelectorAll("img"))
+                    .filter((image) => !image.complete)
+                    .map(loaded);
+                const backgrounds = [card, ...card.querySelectorAll("*")]
+                    .flatMap((element) => Array.from(
+                        getComputedStyle(element).backgroundImage.matchAll(/url\(["']?(.*?)["']?\)/g),
+                        (match) => match[1]
+                    ))
+                    .map((url) => Object.assign(new Image(), { src: url }))
+                    .filter((image) => !image.complete)
+                    .map(loaded);
+                await Promise.all([document.fonts.ready, ...images, ...backgrounds]);
+                done(card);
+            })();
+            """,
+            _CSS_DATA_CARD,
+            _CSS_ARMY_LIST_BUTTON,
+        )
+        return data_card.screenshot_as_png
+
     def fetch_card_from_unit(self, faction: str, unit: str) -> None:
         """
         Fetches the card from the unit.
@@ -246,21 +580,40 @@ class WebScraper:
 
         Returns:
             None
+
+        Raises:
+            WebDriverException: If the card could not be captured after several attempts.
+            OSError: If the card could not be saved.
         """
-        self.driver.get(self.factions_url + faction + "/" + unit)
+        card_path = self.output_dir + faction + "/" + unit + "." + self.card_format
+        if os.path.exists(card_path) and os.path.getsize(card_path) > 0:
+            return
 
-        self.driver.execute_script(
-            """
-            document.querySelector("#btnArmyList").remove();
-            """
-        )
+        card = self.capture_data_card(self.factions_url + faction + "/" + unit)
 
-        os.makedirs(self.output_dir + faction, exist_ok=True)
+        # Re-encoded as a smaller lossless image, then moved so that a partial file is never kept
+        image = Image.open(io.BytesIO(card))
+        if self.card_format == "webp":
+            image.save(card_path + ".part", "WEBP", lossless=True, quality=100, method=6)
+        else:
+            image.save(card_path + ".part", "PNG", optimize=True)
+        os.replace(card_path + ".part", card_path)
 
-        data_card = WebDriverWait(self.driver, 5).until(
-            EC.presence_of_element_located((By.XPATH, '//*[@id="wrapper"]/div[4]'))
-        )
-        data_card.screenshot(self.output_dir + faction + "/" + unit + ".png")
+    def save_progress(self, cards_to_fetch: dict) -> None:
+        """
+        Saves the units left to fetch to temp.json, or removes it once there are none left.
+
+        Args:
+            cards_to_fetch (dict): The units left to fetch, by faction.
+
+        Returns:
+            None
+        """
+        temp_path = self.source_dir + "temp"
+        if any(cards_to_fetch.values()):
+            Utils.dump_dict_to_json(cards_to_fetch, temp_path)
+        elif os.path.isfile(temp_path + ".json"):
+            Utils.remove_file(temp_path + ".json")
 
     def fetch_indexes(self) -> int:
         """
@@ -270,24 +623,24 @@ class WebScraper:
             int: 0 if successful, 1 otherwise.
         """
         try:
-            self.init_session()
+            self.ensure_dirs_exist()
 
-            self.fetch_factions_names()
+            # The browser is only started when a static page could not be used
+            if self.fetch_factions_names_static() != 0:
+                self.fetch_factions_names()
             self.factions_dict = Utils.init_dictionary_with_keys(self.factions_names)
 
+            self.fetch_units_names_static()
             for faction_name in self.factions_names:
-                self.fetch_units_names_from_faction(faction_name)
+                if self.factions_dict[faction_name] is None:
+                    self.fetch_units_names_from_faction(faction_name)
 
             Utils.save_dict_to_json(self.factions_dict, self.source_dir + "index")
-
-            self.close_session()
             return 0
         except KeyboardInterrupt:
             print("\nProcess interrupted by user.")
-            self.close_session()
             return 1
         except Exception as e:
-            self.close_session()
             print(e)
             return 1
 
@@ -297,15 +650,25 @@ class WebScraper:
         "Failed to fetch all cards from faction.",
     )
     def fetch_all_cards_from_faction_logic(self, cards_to_fetch, faction: str) -> int:
+        remaining = collections.deque(cards_to_fetch[faction] or [])
+        failed = []
+        fetched = 0
         try:
-            units_queue = cards_to_fetch[faction][:]
-            while units_queue:
-                unit = units_queue.pop(0)
-                self.fetch_card_from_unit(faction, unit)
-                cards_to_fetch[faction].remove(unit)
-            return 0
-        except Exception:
-            return 1
+            while remaining:
+                try:
+                    self.fetch_card_from_unit(faction, remaining[0])
+                except (WebDriverException, OSError):
+                    # Kept for a later run, the other units of the faction are still fetched
+                    failed.append(remaining[0])
+                remaining.popleft()
+                fetched += 1
+                if fetched % self.checkpoint_interval == 0:
+                    cards_to_fetch[faction] = failed + list(remaining)
+                    self.save_progress(cards_to_fetch)
+            return 0 if not failed else 1
+        finally:
+            # Keep the units that failed or are left to fetch, to resume later
+            cards_to_fetch[faction] = failed + list(remaining)
 
     def fetch_all_cards_from_faction(self, faction: str) -> int:
         """
@@ -317,38 +680,191 @@ class WebScraper:
         Returns:
             int: 0 if successful, 1 otherwise.
         """
-        try:
-            self.init_session()
-            cards_to_fetch = Utils.load_dictionary_if_exists(self.source_dir)
-            if cards_to_fetch is None:
-                print("No dictionary found. Please fetch the indexes first.")
-                return 1
-
-            if faction not in cards_to_fetch.keys():
-                print("The faction does not exist in the dictionary.")
-                return 1
-            cards_to_fetch = {faction: cards_to_fetch[faction]}
+        temp_path = self.source_dir + "temp.json"
+        # A pending job is resumed from temp.json, which has to be kept for its other factions
+        resuming = os.path.isfile(temp_path)
+        cards_to_fetch = Utils.load_dictionary_if_exists(self.source_dir)
+        if cards_to_fetch is None:
+            print("No dictionary found. Please fetch the indexes first.")
+            return 1
 
-            self.fetch_all_cards_from_faction_logic(cards_to_fetch, faction)
+        if faction not in cards_to_fetch.keys():
+            print("The faction does not exist in the dictionary.")
+            if resuming:
+                self.save_progress(cards_to_fetch)
+            return 1
 
-            self.close_session()
-            return 0
+        try:
+            self.ensure_dirs_exist()
+            os.makedirs(self.output_dir + faction, exist_ok=True)
+            self.update_ublock_in_background()
+
+            # The other factions are kept so that the checkpoints of a pending job stay complete
+            result = self.fetch_all_cards_from_faction_logic(cards_to_fetch, faction)
+            if resuming or cards_to_fetch[faction]:
+                self.save_progress(cards_to_fetch)
+            elif os.path.isfile(temp_path):
+                # Only the checkpoints of this faction were saved, and it is now complete
+                Utils.remove_file(temp_path)
+            if result != 0:
+                print("Some cards could not be fetched, they will be retried on the next run.")
+            return result
         except KeyboardInterrupt:
-            print("\nProcess interrupted by user.")
-            self.close_session()
+            print(
+                "\nProcess interrupted by user. The dictionary will be saved to temp.json."
+            )
+            self.save_progress(cards_to_fetch)
             return 1
         except Exception as e:
-            self.close_session()
+            print("An error occurred. The dictionary will be saved to temp.json.")
             print(e)
+            self.save_progress(cards_to_fetch)
             return 1
 
-    def fetch_all_cards_logic(self, cards_to_fetch) -> int:
+    def init_session_pool(self, size: int) -> None:
+        """
+        Fills the pool of scrapers shared by the threads, each one owning its own browser session.
+
+        Args:
+            size (int): The number of scrapers, and so of browsers, in the pool.
+
+        Returns:
+            None
+        """
+        for _ in range(size):
+            self.scrapers_pool.put(WebScraper())
+
+    def close_session_pool(self) -> None:
+        """
+        Closes the browser sessions of the pool of scrapers and empties it.
+
+        Returns:
+            None
+        """
+        Utils.silence_spinners()
         try:
-            for faction in cards_to_fetch.keys():
-                self.fetch_all_cards_from_faction_logic(cards_to_fetch, faction)
-            return 0
-        except Exception:
-            return 1
+            while not self.scrapers_pool.empty():
+                self.scrapers_pool.get().__exit__(None, None, None)
+        finally:
+            Utils.silence_spinners(False)
+
+    def fetch_card_from_pool(self, task: tuple) -> tuple:
+        """
+        Fetches a card with a scraper checked out of the pool, so that a browser is never used
+        by two threads at once.
+
+        Args:
+            task (tuple): The faction and the unit of the card.
+
+        Returns:
+            tuple: The faction, the unit and 0 if successful, 1 otherwise.
+        """
+        faction, unit = task
+        scraper = self.scrapers_pool.get()
+        try:
+            scraper.fetch_card_from_unit(faction, unit)
+            return faction, unit, 0
+        except (WebDriverException, OSError):
+            return faction, unit, 1
+        finally:
+            self.scrapers_pool.put(scraper)
+
+    def fetch_cards_with_threads(self, tasks: list):
+        """
+        Fetches the cards with a pool of threads sharing a pool of browsers.
+
+        Args:
+            tasks (list): The faction and the unit of each card.
+
+        Yields:
+            tuple: The faction, the unit and 0 if successful, 1 otherwise, as they complete.
+        """
+        self.init_session_pool(self.workers)
+        executor = ThreadPoolExecutor(
+            self.workers, initializer=Utils.silence_spinners
+        )
+        try:
+            futures = [executor.submit(self.fetch_card_from_pool, task) for task in tasks]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Only the cards being fetched are awaited before the browsers get closed
+            executor.shutdown(cancel_futures=True)
+            self.close_session_pool()
+
+    @Utils.loading(
+        "Fetching all cards...",
+        "All cards fetched.",
+        "Some cards could not be fetched.",
+    )
+    def record_results(self, cards_to_fetch: dict, results) -> int:
+        """
+        Removes the fetched units from the dictionary as their results come back.
+
+        Args:
+            cards_to_fetch (dict): The units to fetch, by faction.
+            results (Iterable): The faction, the unit and the result of each card.
+
+        Returns:
+            int: 0 if every card was fetched, 1 otherwise.
+        """
+        failures = 0
+        # Removing every unit from its list as it comes back would rescan the list each time
+        fetched = collections.defaultdict(set)
+
+        def remove_fetched() -> None:
+            for faction, units in fetched.items():
+                cards_to_fetch[faction] = [
+                    unit for unit in cards_to_fetch[faction] if unit not in units
+                ]
+            fetched.clear()
+
+        try:
+            for done, (faction, unit, result) in enumerate(results, start=1):
+                if result == 0:
+                    fetched[faction].add(unit)
+                else:
+                    failures += 1
+                if done % self.checkpoint_interval == 0:
+                    remove_fetched()
+                    self.save_progress(cards_to_fetch)
+        finally:
+            # Also on interruptions, so that the progress saved by the caller is up to date
+            remove_fetched()
+        return 0 if failures == 0 else 1
+
+    def fetch_all_cards_logic(self, cards_to_fetch) -> int:
+        """
+        Fetches the cards with a pool of worker processes, or threads if enabled, each one
+        owning its own browser.
+
+        Args:
+            cards_to_fetch (dict): The units to fetch, by faction.
+
+        Returns:
+            int: 0 if every card was fetched, 1 otherwise.
+        """
+        tasks = [
+            (faction, unit)
+            for faction, units in cards_to_fetch.items()
+            for unit in units or []
+        ]
+        if self.use_threads:
+            self.update_ublock_in_background()
+            return self.record_results(
+                cards_to_fetch, self.fetch_cards_with_threads(tasks)
+            )
+
+        with multiprocessing.Pool(self.workers, initializer=_pool_init) as pool:
+            # Started once the workers are forked, so that they never inherit it mid-download
+            self.update_ublock_in_background()
+            result = self.record_results(
+                cards_to_fetch, pool.imap_unordered(_worker_fetch, tasks)
+            )
+            # Let the workers exit gracefully so that their browsers get closed
+            pool.close()
+            pool.join()
+        return result
 
     def fetch_all_cards(self) -> int:
         """
@@ -363,22 +879,73 @@ class WebScraper:
             return 1
 
         try:
-            self.init_session()
-
-            self.fetch_all_cards_logic(cards_to_fetch)
-
-            self.close_session()
-            return 0
+            for faction in cards_to_fetch.keys():
+                os.makedirs(self.output_dir + faction, exist_ok=True)
+            # Prepared once here, the workers never write to the shared directories
+            self.ensure_dirs_exist()
+
+            result = self.fetch_all_cards_logic(cards_to_fetch)
+            self.save_progress(cards_to_fetch)
+            if result != 0:
+                print("Some cards could not be fetched, they will be retried on the next run.")
+            return result
         except KeyboardInterrupt:
             print(
                 "\nProcess interrupted by user. The dictionary will be saved to temp.json."
             )
-            self.close_session()
-            Utils.save_dict_to_json(cards_to_fetch, self.source_dir + "temp")
+            self.save_progress(cards_to_fetch)
             return 1
         except Exception as e:
             print("An error occurred. The dictionary will be saved to temp.json.")
             print(e)
-            self.close_session()
-            Utils.save_dict_to_json(cards_to_fetch, self.source_dir + "temp")
+            self.save_progress(cards_to_fetch)
             return 1
+
+
+_scraper = None
+"""
+The scraper owned by the current worker process. Browsers are never shared between processes.
+"""
+
+
+def _pool_init() -> None:
+    """
+    Initializes the scraper of a worker process, whose browser session lasts for its whole lifetime.
+    """
+    global _scraper
+    # The overall progress is reported by the parent process only
+    Utils.silence_spinners()
+    _scraper = WebScraper().__enter__()
+    # atexit handlers are not run by forked workers, multiprocessing finalizers are
+    Finalize(None, _scraper.__exit__, args=(None, None, None), exitpriority=10)
+    signal.signal(signal.SIGTERM, _exit_worker)
+
+
+def _exit_worker(signum: int, frame) -> None:
+    """
+    Exits the worker process on SIGTERM, as sent by Pool.terminate() when the job fails or is
+    interrupted, so that its finalizers still get to close its browser.
+
+    Args:
+        signum (int): The number of the signal received.
+        frame: The frame interrupted by the signal.
+    """
+    sys.exit(128 + signum)
+
+
+def _worker_fetch(task: tuple) -> tuple:
+    """
+    Fetches a card with the browser session of the current worker process.
+
+    Args:
+        task (tuple): The faction and the unit of the card.
+
+    Returns:
+        tuple: The faction, the unit and 0 if successful, 1 otherwise.
+    """
+    faction, unit = task
+    try:
+        _scraper.fetch_card_from_unit(faction, unit)
+        return faction, unit, 0
+    except (WebDriverException, OSError):
+        return faction, unit, 1
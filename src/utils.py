@@ -2,6 +2,7 @@ import json
 from typing import List, Callable, Any
 from functools import wraps
 from halo import Halo
+import threading
 import time
 import os
 import datetime
@@ -11,6 +12,25 @@ class Utils:
     """
     An utility class for common functions.
     """
+
+    spinners_state = threading.local()
+    """
+    Whether the loading spinners are silenced, for each thread.
+    """
+
+    @staticmethod
+    def silence_spinners(silenced: bool = True) -> None:
+        """
+        Silences the loading spinners of the current thread, and skips their startup time.
+
+        Workers running alongside each other use it so that their spinners do not draw over
+        each other on the same terminal.
+
+        Args:
+            silenced (bool): Whether the spinners are silenced.
+        """
+        Utils.spinners_state.silenced = silenced
+
     @staticmethod
     def clear_console() -> None:
         """
@@ -53,6 +73,8 @@ class Utils:
         def decorator(func: Callable) -> Callable:
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if getattr(Utils.spinners_state, "silenced", False):
+                    return func(*args, **kwargs)
                 spinner = Halo(text=loading_message, spinner=spinner_type)
                 spinner.start()
                 time.sleep(startup_time)
@@ -64,6 +86,42 @@ class Utils:
                     return result
                 except Exception as e:
                     spinner.fail(str(e))
+                    raise
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def retry(
+        exceptions: tuple,
+        excluded: tuple = (),
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+    ) -> Callable:
+        """
+        A decorator for retrying functions on transient failures, with an exponential backoff.
+
+        Args:
+            exceptions (tuple): The exceptions considered transient, any other one is raised at once.
+            excluded (tuple): The subclasses of the transient exceptions to raise at once anyway.
+            max_attempts (int): The maximum number of attempts.
+            backoff (float): The delay before the first retry, doubled on every retry.
+
+        Returns:
+            Callable: The decorated function.
+        """
+
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                for attempt in range(max_attempts):
+                    try:
+                        return func(*args, **kwargs)
+                    except exceptions as e:
+                        if isinstance(e, excluded) or attempt == max_attempts - 1:
+                            raise
+                        time.sleep(backoff * 2**attempt)
 
             return wrapper
 
@@ -143,26 +201,40 @@ class Utils:
             int: 0 if successful, 1 otherwise.
         """
         try:
-            with open(path + ".json", "w") as file:
-                json.dump(dictionary, file)
+            Utils.dump_dict_to_json(dictionary, path)
             return 0
         except Exception:
             return 1
 
     @staticmethod
-    def load_json_dict(path: str) -> dict:
+    def dump_dict_to_json(dictionary: dict, path: str) -> None:
+        """
+        Saves a dictionary to a JSON file, silently. The file is replaced at once, so that an
+        interruption never leaves it truncated.
+
+        Args:
+            dictionary (dict): The dictionary to save.
+            path (str): The path to save the dictionary to.
+        """
+        with open(path + ".json.part", "w") as file:
+            json.dump(dictionary, file)
+        os.replace(path + ".json.part", path + ".json")
+
+    @staticmethod
+    def load_json_dict(path: str, consume_temp: bool = True) -> dict:
         """
         Loads a JSON file as a dictionary.
 
         Args:
             path (str): The path to the JSON file.
+            consume_temp (bool): Whether to remove the file once loaded if it is a temp.json.
 
         Returns:
         dict: The dictionary loaded from the JSON file.
         """
         with open(path, "r") as file:
             data = json.load(file)
-        if os.path.basename(path) == "temp.json":
+        if consume_temp and os.path.basename(path) == "temp.json":
             os.remove(path)
         return data
 
@@ -177,19 +249,22 @@ class Utils:
         os.remove(path)
 
     @staticmethod
-    def load_dictionary_if_exists(directory_path: str) -> dict:
+    def load_dictionary_if_exists(
+        directory_path: str, consume_temp: bool = True
+    ) -> dict:
         """
         Loads a dictionary from a directory if it exists.
 
         Args:
             directory_path (str): The path to the directory.
+            consume_temp (bool): Whether to remove the temp.json once loaded.
 
         Returns:
             dict: The dictionary loaded from the directory if it exists, None otherwise.
         """
         temp_path = os.path.join(directory_path, "temp.json")
         if os.path.isfile(temp_path):
-            return Utils.load_json_dict(temp_path)
+            return Utils.load_json_dict(temp_path, consume_temp)
 
         source_path = os.path.join(directory_path, "index.json")
         if os.path.isfile(source_path):